@@ -8,6 +8,23 @@ from pathlib import Path
 import pandas as pd
 
 
+def _parse_dates(col: pd.Series) -> pd.Series:
+    """Parse a Date column to datetime64.
+
+    Columns openpyxl already read as datetimes are returned untouched. Otherwise
+    the column is parsed as ISO 8601 in one vectorized pass. If anything is left
+    unparsed, the whole column goes through pandas' general inference instead:
+    inferring on just the leftovers would pick one format from the first of them
+    and drop every leftover value in another format.
+    """
+    if pd.api.types.is_datetime64_any_dtype(col):
+        return col
+    parsed = pd.to_datetime(col, format="ISO8601", errors="coerce")
+    if (parsed.isna() & col.notna()).any():
+        return pd.to_datetime(col, errors="coerce")
+    return parsed
+
+
 def load_df(filepath: str | Path = "data/purchases.xlsx") -> pd.DataFrame:
     """Load transactions from an Excel file into a pandas DataFrame.
 
@@ -47,14 +64,13 @@ def load_df(filepath: str | Path = "data/purchases.xlsx") -> pd.DataFrame:
     # Cost may contain commas/strings; try coercion
     df["Cost"] = pd.to_numeric(df["Cost"], errors="coerce")
     # Parse dates if not already
-    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
+    df["Date"] = _parse_dates(df["Date"])
     df["Store"] = df["Store"].fillna("").astype(str)
     df["Tags"] = df["Tags"].fillna("").astype(str)
     df["Notes"] = df["Notes"].fillna("").astype(str)
 
-    # Keep only rows with the minimum required fields present.
-    df = df[df["Item"].str.strip() != ""]
-    df = df[df["Date"].notna()]
-    df = df[df["Cost"].notna()]
+    # Keep only rows with the minimum required fields present
+    keep = (df["Item"].str.strip() != "") & df["Date"].notna() & df["Cost"].notna()
+    df = df[keep]
 
     return df
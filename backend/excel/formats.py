@@ -1,4 +1,5 @@
 from openpyxl.styles import PatternFill, Border, Side, Alignment, Font
+from openpyxl.styles.differential import DifferentialStyle
 
 CATEGORIES = [
     "Food & Beverages",
@@ -19,6 +20,10 @@ FILL_WHITE = PatternFill(fgColor="FFFFFF", fill_type="solid")
 FILL_GREY = PatternFill(fgColor="d9d9d9", fill_type="solid")
 FILL_SUBSCRIPTION = PatternFill(fgColor="fbffa9", fill_type="solid")
 
+# Row fill by month number (index 1-12, index 0 unused): even months white,
+# odd months grey, so consecutive months alternate
+MONTH_FILL = tuple(FILL_WHITE if month % 2 == 0 else FILL_GREY for month in range(13))
+
 FILL_MAP = {
     "Electronics & Accessories": PatternFill(fgColor="729fcf", fill_type="solid"),
     "Movies & Media": PatternFill(fgColor="a05eff", fill_type="solid"),
@@ -30,6 +35,14 @@ FILL_MAP = {
     "Digital Subscriptions": PatternFill(fgColor="fbffa9", fill_type="solid")
 }
 
+# Differential styles for the category conditional formatting rules, from FILL_MAP
+CF_STYLE_MAP = {
+    category_name: DifferentialStyle(
+        fill=PatternFill(start_color=fill.fgColor.rgb, end_color=fill.fgColor.rgb, fill_type="solid")
+    )
+    for category_name, fill in FILL_MAP.items()
+}
+
 # Create thin border style
 SIDE_THIN = Side(style="thin")
 # Define border with left and right
@@ -47,3 +60,14 @@ FONT_BOLD = Font(bold=True)
 FORMAT_MONEY = '"$"* #,##0.00'
 FORMAT_DATE = 'dd/mm/yyyy'
 
+# Per-column (alignment, number format) for the data rows; columns not listed
+# are centered with the default number format
+COLUMN_FORMATS = {
+    "Item": (ALIGN_LEFT, None),
+    "Store": (ALIGN_LEFT, None),
+    "Tags": (ALIGN_LEFT, None),
+    "Notes": (ALIGN_LEFT, None),
+    "Cost": (ALIGN_CENTER, FORMAT_MONEY),
+    "Date": (ALIGN_CENTER, FORMAT_DATE),
+}
+
@@ -1,5 +1,7 @@
 import datetime
+import numpy as np
 import openpyxl
+import pandas as pd
 try:
     from formats import *
 except ModuleNotFoundError:
@@ -8,10 +10,16 @@ except ModuleNotFoundError:
 from openpyxl.worksheet.datavalidation import DataValidation
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.cell.cell import Cell
-from openpyxl.formatting.rule import FormulaRule
-from openpyxl.utils import get_column_letter
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.formatting.rule import Rule
+from openpyxl.utils import column_index_from_string, get_column_letter
 import traceback
 import os
+import shutil
+
+# Blank rows past the data that still get row formatting, category validation
+# and conditional formatting, so new entries typed into the sheet match
+FORMAT_TAIL_ROWS = 149
 
 def remake_xlsx_file(xlsx_path: str = "data/purchases.xlsx") -> None:
     """Remake the workbook at `xlsx_path` for the app.
@@ -71,7 +79,8 @@ def remake_xlsx_file(xlsx_path: str = "data/purchases.xlsx") -> None:
         backup_name = f"{os.path.splitext(base)[0]}_backup_{now}.xlsx"
         backup_path = os.path.join(folder, backup_name)
         
-        wb.save(backup_path)
+        # Byte-for-byte copy of the workbook file as it was loaded
+        shutil.copy2(xlsx_path, backup_path)
     except Exception as e:
         raise RuntimeError(f"Failed to create backup at '{backup_path}': {type(e).__name__}: {e}\nTraceback: {traceback.format_exc()}") from e
 
@@ -83,10 +92,9 @@ def remake_xlsx_file(xlsx_path: str = "data/purchases.xlsx") -> None:
     # Determine header row (assume row 1) and map headers to columns
     headers = {}
     for col_idx in range(1, ws.max_column + 1):
-        letter = get_column_letter(col_idx)
-        cell = ws[f"{letter}1"]
+        cell = ws.cell(row=1, column=col_idx)
         if cell.value:
-            headers[str(cell.value).strip()] = letter
+            headers[str(cell.value).strip()] = get_column_letter(col_idx)
 
     # If expected headers are absent, we'll initialize columns A-G using the new layout
     default_cols = {
@@ -108,78 +116,83 @@ def remake_xlsx_file(xlsx_path: str = "data/purchases.xlsx") -> None:
     # Collect data rows (from row 2 to last non-empty row) and sort by Date
     data_rows = []
     max_row = ws.max_row
-    # read values for all columns currently used (we'll keep the full row as a list)
-    for r in range(2, max_row + 1):
-        # Determine if the row is empty by checking the Item column (B)
-        item_cell = ws[f"{cols.get('Item')[0]}{r}"]
-        if item_cell.value is None:
+    # read values for columns A-G row by row (we'll keep the full row as a list)
+    item_index = column_index_from_string(cols["Item"][0]) - 1
+
+    # Last row with a filled Item; the full-width read below stops there
+    item_values = next(ws.iter_cols(min_col=item_index + 1, max_col=item_index + 1,
+                                    min_row=2, max_row=max_row, values_only=True), ())
+    last_item_row = 1
+    for offset in range(len(item_values) - 1, -1, -1):
+        if item_values[offset] is not None:
+            last_item_row = offset + 2
+            break
+
+    # Current values per row from row 2 (empty rows included), for the write-back
+    sheet_rows = []
+    for row_values in ws.iter_rows(min_row=2, max_row=last_item_row, max_col=len(default_cols), values_only=True):
+        sheet_rows.append(row_values)
+        # Skip rows with an empty Item column
+        if row_values[item_index] is None:
             continue
-        row_values = []
-        for key in default_cols:
-            letter = cols[key][0]
-            row_values.append(ws[f"{letter}{r}"].value)
-        data_rows.append(row_values)
+        data_rows.append(list(row_values))
 
     # Attempt to identify which column index corresponds to Date (by header name)
     date_col_letter = cols.get('Date')[0]
     date_col_index = None
     try:
         # convert letter to 0-based index
-        date_col_index = openpyxl.utils.column_index_from_string(date_col_letter) - 1
+        date_col_index = column_index_from_string(date_col_letter) - 1
     except Exception:
         date_col_index = None
 
-    # Parse and sort rows by date if possible; otherwise keep original order
-    def _parse_date(val):
-        try:
-            if isinstance(val, datetime.datetime) or isinstance(val, datetime.date):
-                return datetime.datetime(val.year, val.month, val.day)
-            return datetime.datetime.fromisoformat(str(val))
-        except Exception:
-            try:
-                # fallback to pandas parser if available
-                import dateutil.parser as _dp
-                return _dp.parse(str(val))
-            except Exception:
-                return None
-
+    # Parse and sort rows by date if possible; otherwise keep original order.
+    # Only dates and strings are parsed; anything else (and any string pandas
+    # can't read) counts as unparseable.
     if date_col_index is not None:
-        sortable = []
-        nonsortable = []
-        for row in data_rows:
-            try:
-                d = row[date_col_index]
-            except Exception:
-                d = None
-            parsed = _parse_date(d)
-            if parsed is not None:
+        raw_dates = [
+            row[date_col_index] if isinstance(row[date_col_index], (datetime.date, str)) else None
+            for row in data_rows
+        ]
+        # Dates are kept at day resolution, matching the dd/mm/yyyy column format
+        parsed = pd.to_datetime(pd.Series(raw_dates, dtype=object), format="mixed", errors="coerce").dt.normalize()
+        parsed_values = parsed.to_numpy(dtype="datetime64[ns]")
+        # Python datetimes for writing back (datetime64[us] converts to
+        # datetime.datetime, NaT to None)
+        py_dates = parsed_values.astype("datetime64[us]").tolist()
+
+        # Stable sort by parsed date (oldest -> newest); NaT sorts last, so
+        # unparseable rows keep their original order at the end
+        sorted_rows = []
+        for i in np.argsort(parsed_values, kind="stable").tolist():
+            row = data_rows[i]
+            if py_dates[i] is not None:
                 # replace the date cell value with the parsed datetime so Excel
                 # interprets it as a date rather than a string when we write it back
-                row_copy = list(row)
-                row_copy[date_col_index] = parsed
-                sortable.append((parsed, row_copy))
-            else:
-                nonsortable.append(row)
-
-        # sort by parsed date (oldest -> newest)
-        sortable.sort(key=lambda x: x[0])
-        sorted_rows = [r for _, r in sortable] + nonsortable
+                row[date_col_index] = py_dates[i]
+            sorted_rows.append(row)
     else:
         sorted_rows = data_rows
 
-    # Clear existing data rows (from row 2 onward) to rewrite sorted rows
-    for r in range(2, ws.max_row + 1):
-        for key in default_cols:
-            letter = cols[key][0]
-            ws[f"{letter}{r}"] = None
-
-    # Write back sorted rows starting at row 2
+    # Write back sorted rows starting at row 2, skipping rows already in place,
+    # then clear the rows left over below them
+    cell_at = ws.cell
+    col_range = range(1, len(default_cols) + 1)
+    n_sheet_rows = len(sheet_rows)
+    old_max_row = ws.max_row
     write_row = 2
     for row in sorted_rows:
-        for idx, key in enumerate(default_cols, start=1):
-            letter = cols[key][0]
-            ws[f"{letter}{write_row}"] = row[idx - 1]
+        if write_row - 2 < n_sheet_rows and sheet_rows[write_row - 2] == tuple(row):
+            write_row += 1
+            continue
+        for col_idx, value in zip(col_range, row):
+            # assign .value directly: ws.cell(value=None) would leave the old value
+            cell_at(row=write_row, column=col_idx).value = value
         write_row += 1
+
+    for r in range(write_row, old_max_row + 1):
+        for col_idx in col_range:
+            cell_at(row=r, column=col_idx).value = None
         
     # Reset autofilter across A:G
     try:
@@ -187,12 +200,16 @@ def remake_xlsx_file(xlsx_path: str = "data/purchases.xlsx") -> None:
     except Exception:
         pass
 
+    # Formatting, validation and conditional formatting run past the last data
+    # row (ws.max_row also counts the blank tail styled by the previous remake)
+    last_data_row = write_row - 1
+
     # Recreate category DV and CF using column B
-    xlsx_create_category_dv(ws, cols.get("Category")[0])
-    xlsx_create_category_cf(ws, cols.get("Category")[0])
+    xlsx_create_category_dv(ws, cols.get("Category")[0], last_data_row)
+    xlsx_create_category_cf(ws, cols.get("Category")[0], last_data_row)
 
     # Apply row formatting based on our cols mapping
-    xlsx_format_rows(ws, cols)
+    xlsx_format_rows(ws, cols, last_data_row)
 
     # Save workbook with error handling
     try:
@@ -204,7 +221,7 @@ def remake_xlsx_file(xlsx_path: str = "data/purchases.xlsx") -> None:
 
 def xlsx_init_column(ws: Worksheet, col_letter: str, text: str, width: float):
     # Create Header Object
-    header_cell: Cell = ws[f"{col_letter}{1}"]
+    header_cell: Cell = ws.cell(row=1, column=column_index_from_string(col_letter))
     header_cell.value = text
     header_cell.font = FONT_BOLD
     header_cell.alignment = ALIGN_CENTER
@@ -215,82 +232,141 @@ def xlsx_init_column(ws: Worksheet, col_letter: str, text: str, width: float):
     col_obj.width = width
     
     
-def xlsx_format_rows(ws: Worksheet, cols: dict):
-    item_col = cols.get("Item")[0]
-    date_col = cols.get("Date")[0]
-    category_col = cols.get("Category")[0]
-    
-    for row in range(2, ws.max_row + 150):
+def xlsx_format_rows(ws: Worksheet, cols: dict, last_data_row: int | None = None):
+    # 0-based positions within each row tuple from iter_rows
+    col_index = {col: column_index_from_string(letter) - 1 for col, (letter, width) in cols.items()}
+    item_idx = col_index["Item"]
+    date_idx = col_index["Date"]
+    category_idx = col_index["Category"]
+    # (column, position, alignment, number format) for each column
+    col_items = [(col, idx) + COLUMN_FORMATS.get(col, (ALIGN_CENTER, None)) for col, idx in col_index.items()]
+    max_col = max(col_index.values()) + 1
+
+    # Bind the shared styles to locals for the inner loop
+    fill_white, fill_subscription, month_fill = FILL_WHITE, FILL_SUBSCRIPTION, MONTH_FILL
+    border = BORDER_LEFT_RIGHT
+    # (column, fill, starting style) -> finished style, see below
+    style_cache = {}
+
+    def style_row(row_cells, fill):
+        # Update values in each individual cell
+        for col, col_idx, alignment, number_format in col_items:
+            cell: Cell = row_cells[col_idx]
+
+            # Reuse the finished style of an earlier cell in this column with the
+            # same fill and starting style
+            style_key = (col, id(fill), _get_style_ids(cell))
+            cached_style = style_cache.get(style_key)
+            if cached_style is not None:
+                _set_style_ids(cell, cached_style)
+                continue
+
+            cell.border = border
+            # Default variables
+            cell.fill = fill
+            cell.alignment = alignment
+            if number_format is not None:
+                cell.number_format = number_format
+
+            style_cache[style_key] = _get_style_ids(cell)
+
+    # Rows past the known last data row are blank and get the white fill
+    last_row = _last_formatted_row(ws, last_data_row)
+    data_end_row = last_row if last_data_row is None else max(last_data_row, 1)
+
+    for row_cells in ws.iter_rows(min_row=2, max_row=data_end_row, max_col=max_col):
         # We're tracking if there is an entry in this part so we can continue adding formatting if there is no data
-        item_cell = ws[f"{item_col}{row}"]
+        item_cell = row_cells[item_idx]
         is_empty = item_cell.value is None
         
         # Sets the fill of the cell based on the month
         if not is_empty:
-            date_cell: Cell = ws[f"{date_col}{row}"]
+            date_cell: Cell = row_cells[date_idx]
             date_value: datetime = date_cell.value
             
-            # Handle case where item exists but date is None/empty
-            if date_value is not None:
-                try:
-                    month = date_value.month
-                    fill = FILL_WHITE if month % 2 == 0 else FILL_GREY
-                except AttributeError:
-                    # date_value is not a datetime object
-                    fill = FILL_WHITE
+            # Handle case where item exists but date is None/empty or an unparseable string
+            if isinstance(date_value, datetime.date):
+                fill = month_fill[date_value.month]
             else:
-                # date_value is None
-                fill = FILL_WHITE
+                fill = fill_white
         else:
-            fill = FILL_WHITE
+            fill = fill_white
         
         # If the item is a subscription, change the fill to yellow
-        category_cell = ws[f"{category_col}{row}"]
+        category_cell = row_cells[category_idx]
         category_value = category_cell.value
         if is_empty:
             pass
         elif category_value == "Digital Subscriptions":
-            fill = FILL_SUBSCRIPTION
+            fill = fill_subscription
         
-        # Update values in each individual cell
-        for col, (col_letter, width) in cols.items():
-            cell: Cell = ws[f"{col_letter}{row}"]
-            cell.border = BORDER_LEFT_RIGHT
-            # Default variables
-            cell.fill = fill
-            cell.alignment = ALIGN_CENTER 
-            
-            if col in ("Item", "Store", "Tags", "Notes"):
-                cell.alignment = ALIGN_LEFT
-            elif col == "Cost":
-                cell.number_format = FORMAT_MONEY
-            elif col == "Date":
-                cell.number_format = FORMAT_DATE
-                
-
-def xlsx_create_category_dv(ws: Worksheet, category_col: str = "C"):
+        style_row(row_cells, fill)
+
+    for row_cells in ws.iter_rows(min_row=data_end_row + 1, max_row=last_row, max_col=max_col):
+        style_row(row_cells, fill_white)
+
+
+def xlsx_create_category_dv(ws: Worksheet, category_col: str = "C", last_data_row: int | None = None):
     # Create a string for the formula (must be double-quoted and comma-separated)
     category_list = '"' + ",".join(CATEGORIES) + '"'
 
+    # Drop the validation left by a previous remake, otherwise every remake
+    # stacks another copy of it into the saved workbook
+    ws.data_validations.dataValidation = [
+        existing for existing in ws.data_validations.dataValidation
+        if not (existing.type == "list" and existing.formula1 == category_list)
+    ]
+
     # Create a DataValidation object
     dv = DataValidation(type="list", formula1=category_list, allow_blank=True)
 
     # Add the DataValidation to the worksheet
     ws.add_data_validation(dv)
 
-    # Apply it to Category column rows 2..(max_row*2)
-    dv.add(f"{category_col}2:{category_col}{(int)(ws.max_row*2)}")
+    # Apply it to the Category column over the formatted rows, blank tail included
+    dv.add(f"{category_col}2:{category_col}{_last_formatted_row(ws, last_data_row)}")
     
 
-def xlsx_create_category_cf(ws: Worksheet, category_col: str = "C"):
-    # Apply conditional formatting based on FILL_MAP
-    for category_name, pattern_fill in FILL_MAP.items():
-        color = pattern_fill.fgColor.rgb  # Get RGB value
+def xlsx_create_category_cf(ws: Worksheet, category_col: str = "C", last_data_row: int | None = None):
+    # Lock category column, row can move
+    category_formulas = {category_name: f'${category_col}2="{category_name}"' for category_name in FILL_MAP}
+    formulas = set(category_formulas.values())
+
+    # Drop the category rules left by a previous remake so they don't pile up
+    for existing in list(ws.conditional_formatting):
+        if existing.rules and all(rule.formula and rule.formula[0] in formulas for rule in existing.rules):
+            del ws.conditional_formatting[str(existing.sqref)]
+
+    cf_range = f"{category_col}2:{category_col}{_last_formatted_row(ws, last_data_row)}"
 
-        # Create a formula rule
-        formula = f'${category_col}2="{category_name}"'  # Lock category column, row can move
-        rule = FormulaRule(formula=[formula], stopIfTrue=True, fill=PatternFill(start_color=color, end_color=color, fill_type="solid"))
+    # Apply conditional formatting based on FILL_MAP (a new Rule each time:
+    # adding one to a sheet sets its priority)
+    for category_name, formula in category_formulas.items():
+        rule = Rule(type="expression", formula=[formula], stopIfTrue=True, dxf=CF_STYLE_MAP[category_name])
 
         # Add the rule to the worksheet
-        ws.conditional_formatting.add(f"{category_col}2:{category_col}{ws.max_row*2}", rule)
+        ws.conditional_formatting.add(cf_range, rule)
+
+
+# The two helpers below read and write openpyxl's private Cell._style, the
+# array of workbook style ids behind a cell's public style attributes. They
+# depend on openpyxl internals as of the pinned openpyxl==3.1.5.
+def _get_style_ids(cell: Cell) -> tuple | None:
+    """Return the cell's style ids as a hashable tuple, or None if it was never styled."""
+    style = cell._style
+    return None if style is None else tuple(style)
 
+
+def _set_style_ids(cell: Cell, style_ids: tuple) -> None:
+    """Give the cell the style ids returned by _get_style_ids for another cell."""
+    cell._style = StyleArray(style_ids)
+
+
+def _last_formatted_row(ws: Worksheet, last_data_row: int | None = None) -> int:
+    """Last row xlsx_format_rows styles: the data plus FORMAT_TAIL_ROWS blank rows.
+
+    Falls back to ws.max_row when the last data row isn't known.
+    """
+    if last_data_row is None:
+        last_data_row = ws.max_row
+    return max(last_data_row, 1) + FORMAT_TAIL_ROWS
@@ -13,23 +13,31 @@ def get_transactions(year: str = Query(default=None, description="Filter by year
                      start_date: str = Query(default=None, description="Filter by a start date, e.g. '2025-01-01'"),
                      end_date: str = Query(default=None, description="Filter by an end date, e.g. '2025-12-31'")):
     """Return all transactions, optionally filtered by year."""
-    df = load_df("data/purchases.xlsx")
-    result = df.copy()
+    # load_df builds a fresh frame per call; the filters below combine into one mask
+    result = load_df("data/purchases.xlsx")
+    dates = result["Date"]
+    keep = pd.Series(True, index=result.index)
     if year:
-        result = result[result["Date"].dt.year.astype(str) == year]
+        # Only a plain year string like '2025' can match
+        if year.isdecimal() and str(int(year)) == year:
+            keep &= dates.dt.year == int(year)
+        else:
+            keep &= False
     if start_date:
-        result = result[result["Date"] >= pd.to_datetime(start_date)]
+        keep &= dates >= pd.to_datetime(start_date)
     if end_date:
-        result = result[result["Date"] <= pd.to_datetime(end_date)]
+        keep &= dates <= pd.to_datetime(end_date)
+    result = result[keep]
 
-    result["Date"] = result["Date"].dt.strftime("%Y-%m-%d")
     response_cols = ["Item", "Category", "Cost", "Date", "Store", "Tags", "Notes"]
-    return result[response_cols].to_dict(orient="records")
+    result = result[response_cols].assign(Date=result["Date"].dt.strftime("%Y-%m-%d"))
+    return result.to_dict(orient="records")
 
 
 @router.get("/years")
 def get_years():
     """Return the list of distinct years present in the data."""
     df = load_df("data/purchases.xlsx")
-    years = sorted(df["Date"].dt.year.dropna().astype(int).astype(str).unique().tolist())
+    # Dedupe the integer years first, then stringify only the distinct few
+    years = [str(y) for y in sorted(df["Date"].dt.year.dropna().astype(int).unique().tolist())]
     return {"years": years}
@@ -86,9 +86,8 @@ export function bucketTransactions(transactions, bucketDays = 28) {
 export function bucketTransactionsByMonth(transactions) {
   if (!transactions || transactions.length === 0) return []
 
+  // Keyed by month index (year * 12 + month)
   const map = new Map()
-  let minDate = null
-  let maxDate = null
 
   for (const tx of transactions) {
     const date = new Date(tx.Date)
@@ -96,31 +95,27 @@ export function bucketTransactionsByMonth(transactions) {
     const cost = parseFloat(tx.Cost)
     if (isNaN(cost)) continue
 
-    // Create key as YYYY-MM to group by month
-    const year = date.getFullYear()
-    const month = String(date.getMonth() + 1).padStart(2, '0')
-    const key = `${year}-${month}`
-
-    // Store the first day of the month as the timestamp
-    const monthStart = new Date(year, date.getMonth(), 1)
-    const timestamp = monthStart.getTime()
-
-    map.set(key, { timestamp, cost: (map.get(key)?.cost ?? 0) + cost })
-    minDate = minDate == null ? date : new Date(Math.min(minDate.getTime(), date.getTime()))
-    maxDate = maxDate == null ? date : new Date(Math.max(maxDate.getTime(), date.getTime()))
+    const monthIndex = (date.getFullYear() * 12) + date.getMonth()
+    map.set(monthIndex, (map.get(monthIndex) ?? 0) + cost)
   }
 
-  if (minDate == null || maxDate == null) return []
+  return Array.from(map.entries())
+    .sort((a, b) => a[0] - b[0])
+    .map(([monthIndex, cost]) => ({
+      x: new Date(Math.floor(monthIndex / 12), monthIndex % 12, 1).getTime(),
+      y: cost,
+    }))
+}
 
-  const points = []
-  const seen = new Set()
-  for (const { timestamp, cost } of map.values()) {
-    if (!seen.has(timestamp)) {
-      points.push({ x: timestamp, y: cost })
-      seen.add(timestamp)
-    }
-  }
-  return points.sort((a, b) => a.x - b.x)
+/**
+ * Buckets transactions by day range or calendar month.
+ *
+ * @param {Array} transactions
+ * @param {number|string} bucketDays - bucket size in days or 'month' for calendar months
+ * @returns {Array<{x: number, y: number}>}
+ */
+export function bucketByPeriod(transactions, bucketDays) {
+  return bucketDays === 'month' ? bucketTransactionsByMonth(transactions) : bucketTransactions(transactions, bucketDays)
 }
 
 /**
@@ -132,7 +127,7 @@ export function bucketTransactionsByMonth(transactions) {
  * @returns {Array} ApexCharts series array
  */
 export function toSpendingSeries(transactions, bucketDays = 28) {
-  const data = bucketDays === 'month' ? bucketTransactionsByMonth(transactions) : bucketTransactions(transactions, bucketDays)
+  const data = bucketByPeriod(transactions, bucketDays)
   return [{ name: 'Spending', data }]
 }
 
@@ -146,17 +141,22 @@ export function toSpendingSeries(transactions, bucketDays = 28) {
  * @returns {Array} ApexCharts series array
  */
 export function toMovingAverageSeries(transactions, bucketDays = 1) {
-  const bucketed = bucketDays === 'month' ? bucketTransactionsByMonth(transactions) : bucketTransactions(transactions, bucketDays)
+  const bucketed = bucketByPeriod(transactions, bucketDays)
   if (bucketed.length === 0) return []
 
   const windowSize = 3
-  const data = bucketed.map((p, i) => {
-    const start = Math.max(0, i - Math.floor(windowSize / 2))
-    const end = Math.min(bucketed.length, i + Math.floor(windowSize / 2) + 1)
-    const window = bucketed.slice(start, end)
-    const avg = window.reduce((sum, point) => sum + point.y, 0) / window.length
-    return { x: p.x, y: parseFloat(avg.toFixed(2)) }
-  })
+  const half = Math.floor(windowSize / 2)
+  const n = bucketed.length
+  const data = new Array(n)
+  // Sum each centred window in place
+  for (let i = 0; i < n; i++) {
+    const start = Math.max(0, i - half)
+    const end = Math.min(n, i + half + 1)
+    let sum = 0
+    for (let k = start; k < end; k++) sum += bucketed[k].y
+    const avg = sum / (end - start)
+    data[i] = { x: bucketed[i].x, y: parseFloat(avg.toFixed(2)) }
+  }
 
   return [{ name: 'Moving Average', data }]
 }
@@ -170,7 +170,7 @@ export function toMovingAverageSeries(transactions, bucketDays = 1) {
  * @returns {number}
  */
 export function computeAverage(transactions, bucketDays = 28) {
-  const bucketed = bucketDays === 'month' ? bucketTransactionsByMonth(transactions) : bucketTransactions(transactions, bucketDays)
+  const bucketed = bucketByPeriod(transactions, bucketDays)
   if (bucketed.length === 0) return 0
   const total = bucketed.reduce((sum, p) => sum + p.y, 0)
   return total / bucketed.length
@@ -261,12 +261,15 @@ export function toCumulativeCategorySeries(transactions, bucketDays = 28) {
     ...new Set(rawSeries.flatMap(s => s.data.map(p => p.x))),
   ].sort((a, b) => a - b)
 
+  // Each series' timestamps are a sorted subset of the shared timeline; walk
+  // both together and carry the running total forward
   const series = rawSeries.map(s => {
-    const pointMap = new Map(s.data.map(p => [p.x, p.y]))
+    let j = 0
     let lastValue = 0
     const data = allTimestamps.map(x => {
-      if (pointMap.has(x)) {
-        lastValue = pointMap.get(x)
+      if (j < s.data.length && s.data[j].x === x) {
+        lastValue = s.data[j].y
+        j++
       }
       return { x, y: lastValue }
     })
@@ -351,6 +354,10 @@ export function toCategoryMonthlyAverageDonutSeries(transactions) {
     .sort((a, b) => b.value - a.value)
 }
 
+// Full month names by month index (0 = January)
+const MONTH_NAME_FORMAT = new Intl.DateTimeFormat('en-AU', { month: 'long' })
+const MONTH_NAMES_LONG = Array.from({ length: 12 }, (_, m) => MONTH_NAME_FORMAT.format(new Date(2000, m, 1)))
+
 /**
  * Groups transactions by calendar month and returns donut-ready series.
  * Month name and sort order are derived from the Date field — Month/MonthNum
@@ -363,26 +370,27 @@ export function toCategoryMonthlyAverageDonutSeries(transactions) {
 export function toMonthlyDonutSeries(transactions) {
   if (!transactions || transactions.length === 0) return []
 
-  // Derive month number and name from the Date string — no Month/MonthNum fields needed
-  const map = new Map()
+  // Derive the month from the Date string — no Month/MonthNum fields needed.
+  // One total slot per calendar month (0 = January), already in month order
+  const totals = new Array(12).fill(null)
   for (const tx of transactions) {
     const date = new Date(tx.Date)
     if (isNaN(date)) continue
     const cost = parseFloat(tx.Cost)
     if (isNaN(cost)) continue
-    // Zero-padded month number as sort key, e.g. "01", "12"
-    const monthNum  = String(date.getMonth() + 1).padStart(2, '0')
-    const monthName = date.toLocaleString('en-AU', { month: 'long' })  // e.g. "January"
-    const key = `${monthNum}_${monthName}`
-    map.set(key, (map.get(key) ?? 0) + cost)
+    const month = date.getMonth()
+    totals[month] = (totals[month] ?? 0) + cost
   }
 
-  return Array.from(map.entries())
-    .sort(([a], [b]) => a.localeCompare(b))
-    .map(([key, value]) => ({
-      label: key.split('_')[1],
-      value: parseFloat(value.toFixed(2)),
-    }))
+  const result = []
+  for (let month = 0; month < 12; month++) {
+    if (totals[month] == null) continue  // no transactions that month
+    result.push({
+      label: MONTH_NAMES_LONG[month],  // e.g. "January"
+      value: parseFloat(totals[month].toFixed(2)),
+    })
+  }
+  return result
 }
 
 /**
@@ -416,7 +424,9 @@ export function toStoreDonutSeries(transactions) {
  *
  * Each bar = one item. Each segment within a bar = one individual purchase.
  * Number of series = number of times the most-purchased item was bought.
- * Items with fewer purchases get 0 in the higher slots.
+ * Items with fewer purchases get null in the higher slots, so the chart has no
+ * zero-width segment to lay out or draw there. Each series' `details` holds the
+ * source transaction per segment (or null), for the chart to format on hover.
  *
  * @param {Array}  transactions  - raw transaction objects (must have Item, Cost, Category)
  * @param {number} topN          - how many items to include (default 10)
@@ -427,58 +437,75 @@ export function toTopItemsSeries(transactions, topN = 10) {
     return { series: [], itemNames: [], itemColors: [] }
   }
 
-  // 1. Group by Item — collect purchases and the dominant category
-  const groups = {}
+  // 1. Group by Item — each purchase's cost and source transaction, the
+  //    running total and per-category counts
+  const groups = new Map()
   for (const tx of transactions) {
     const name = tx.Item ?? 'Unknown'
-    if (!groups[name]) groups[name] = { purchases: [], categories: {} }
+    let g = groups.get(name)
+    if (!g) {
+      g = { costs: [], txs: [], total: 0, categories: {} }
+      groups.set(name, g)
+    }
     const cost = parseFloat(tx.Cost)
     if (!isNaN(cost)) {
-      groups[name].purchases.push({
-        cost,
-        store: String(tx.Store || '').trim(),
-        tags: String(tx.Tags || '').trim(),
-        notes: String(tx.Notes || '').trim(),
-      })
+      g.costs.push(cost)
+      g.txs.push(tx)
+      g.total += cost
     }
     const cat = tx.Category ?? 'Miscellaneous'
-    groups[name].categories[cat] = (groups[name].categories[cat] ?? 0) + 1
+    g.categories[cat] = (g.categories[cat] ?? 0) + 1
   }
 
-  // 2. Sort by total spend descending, pick top N
-  const itemNames = Object.entries(groups)
-    .map(([name, g]) => ({ name, total: g.purchases.reduce((s, p) => s + p.cost, 0) }))
-    .sort((a, b) => b.total - a.total)
-    .slice(0, topN)
-    .map(x => x.name)
+  // 2. Pick the top N by total spend, descending, by insertion into a running
+  //    top-N list; an item only moves ahead of strictly smaller totals, so
+  //    ties keep first-seen order
+  const top = []
+  if (topN > 0) {
+    for (const [name, g] of groups) {
+      const total = g.total
+      if (top.length === topN && !(total > top[topN - 1].total)) continue
+      let i = top.length
+      while (i > 0 && total > top[i - 1].total) i--
+      top.splice(i, 0, { name, total })
+      if (top.length > topN) top.pop()
+    }
+  }
+  const itemNames = top.map(x => x.name)
 
   // 3. One color per item — derived from its most-common category
+  //    (first seen wins a tie)
   const itemColors = itemNames.map(name => {
-    const cats = groups[name].categories
-    const dominant = Object.entries(cats).sort((a, b) => b[1] - a[1])[0][0]
+    let dominant = null
+    let best = -1
+    for (const [cat, count] of Object.entries(groups.get(name).categories)) {
+      if (count > best) {
+        dominant = cat
+        best = count
+      }
+    }
     return getCategoryColor(dominant)
   })
 
   // 4. How many slots = max purchase count across top items
-  const maxSlots = Math.max(...itemNames.map(name => groups[name].purchases.length))
+  const topGroups = itemNames.map(name => groups.get(name))
+  const maxSlots = Math.max(...topGroups.map(g => g.costs.length))
 
-  // 5. Transpose into slot-major series
-  const series = []
+  // 5. Transpose into slot-major series, filling each slot's data and
+  //    details together
+  const itemCount = topGroups.length
+  const series = new Array(Math.max(0, maxSlots))
   for (let slot = 0; slot < maxSlots; slot++) {
-    series.push({
-      name: `Purchase ${slot + 1}`,
-      data: itemNames.map(name => {
-        const purchases = groups[name].purchases
-        return purchases[slot] ? parseFloat(purchases[slot].cost.toFixed(2)) : 0
-      }),
-      details: itemNames.map(name => {
-        const purchases = groups[name].purchases
-        const purchase = purchases[slot]
-        return purchase
-          ? { store: purchase.store, tags: purchase.tags, notes: purchase.notes }
-          : null
-      }),
-    })
+    const data = new Array(itemCount)
+    // The purchase's source transaction, formatted by the chart on hover
+    const details = new Array(itemCount)
+    for (let i = 0; i < itemCount; i++) {
+      const g = topGroups[i]
+      const has = slot < g.costs.length
+      data[i] = has ? parseFloat(g.costs[slot].toFixed(2)) : null
+      details[i] = has ? g.txs[slot] : null
+    }
+    series[slot] = { name: `Purchase ${slot + 1}`, data, details }
   }
 
   return { series, itemNames, itemColors }
@@ -517,7 +544,8 @@ export function computeStats(transactions) {
     }
   }
 
-  const costs = transactions.map(t => t.Cost).sort((a, b) => a - b)
+  // Typed array, so sort() is numeric; the percentiles below index into it
+  const costs = Float64Array.from(transactions, t => t.Cost).sort()
   const count = costs.length
   const total = costs.reduce((s, c) => s + c, 0)
   const mean  = total / count
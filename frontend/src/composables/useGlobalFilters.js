@@ -120,12 +120,15 @@ async function fetchYears(force = false) {
  */
 async function initFilters() {
   hydrateSessionState()
-  await fetchYears()
+
+  // Request years and transactions together
+  const pending = [fetchYears()]
 
   // Fetch transactions if not yet loaded (e.g. first page visit)
   if (transactions.value.length === 0) {
-    await fetchTransactions(selectedYear.value)
+    pending.push(fetchTransactions(selectedYear.value))
   }
+  await Promise.all(pending)
 }
 
 // Re-fetch whenever the year changes.
@@ -137,8 +140,7 @@ async function refreshTransactions() {
 }
 
 async function reloadFromXlsx() {
-  await fetchYears(true)
-  await fetchTransactions(selectedYear.value)
+  await Promise.all([fetchYears(true), fetchTransactions(selectedYear.value)])
 }
 
 // Public API
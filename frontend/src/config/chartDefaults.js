@@ -0,0 +1,9 @@
+import { Chart as ChartJS } from 'chart.js'
+
+/**
+ * App-wide Chart.js defaults, applied once at startup.
+ * Component options only carry what is specific to each chart.
+ */
+ChartJS.defaults.animation = false
+ChartJS.defaults.maintainAspectRatio = false
+ChartJS.defaults.scale.grid.color = 'rgba(0,0,0,0.05)'
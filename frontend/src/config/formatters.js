@@ -0,0 +1,38 @@
+/**
+ * formatters.js
+ *
+ * Shared number formatters for chart labels, ticks and tooltips,
+ * built once at module load.
+ */
+
+export const CURRENCY_FORMAT = new Intl.NumberFormat('en-AU', { minimumFractionDigits: 2, maximumFractionDigits: 2 })
+export const NUMBER_FORMAT = new Intl.NumberFormat('en-AU', { maximumFractionDigits: 2 })
+export const INTEGER_FORMAT = new Intl.NumberFormat('en-AU', { maximumFractionDigits: 0 })
+
+/**
+ * Formats a number as a dollar amount with two decimals, e.g. "$1,234.50".
+ * @param {number|string} value
+ * @returns {string}
+ */
+export function formatMoney(value) {
+  return `$${CURRENCY_FORMAT.format(value)}`
+}
+
+// Formatted tick labels by value, cleared wholesale past TICK_CACHE_LIMIT entries
+const tickLabelCache = new Map()
+const TICK_CACHE_LIMIT = 500
+
+/**
+ * Memoized formatMoney for axis tick callbacks.
+ * @param {number} value
+ * @returns {string}
+ */
+export function formatMoneyTick(value) {
+  let label = tickLabelCache.get(value)
+  if (label === undefined) {
+    if (tickLabelCache.size >= TICK_CACHE_LIMIT) tickLabelCache.clear()
+    label = formatMoney(value)
+    tickLabelCache.set(value, label)
+  }
+  return label
+}